@@ -13,13 +13,17 @@ from __future__ import annotations
 import datetime
 import json
 import logging
+import os
 import signal
 import socket
 import shutil
+import struct
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -27,9 +31,20 @@ from gpiozero import Button
 from luma.core.interface.serial import i2c
 from luma.core.render import canvas
 from luma.oled.device import sh1106
-from PIL import ImageFont
+from PIL import Image, ImageDraw, ImageFont
 from pymodbus.client import ModbusTcpClient
 
+try:
+    from smbus2 import SMBus, i2c_msg
+except ImportError:  # pragma: no cover - optional, falls back to luma i2c
+    SMBus = None
+
+try:
+    import gpiod
+    from gpiod.line import Bias, Direction, Value
+except ImportError:  # pragma: no cover - optional, falls back to gpiozero
+    gpiod = None
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -82,6 +97,17 @@ SCREEN_COUNT: int = 4
 AUTO_RESET_TICKS: int = 10
 SWITCH_CONFIRM_S: float = 5.0
 
+def _to_signed16(raw: int) -> int:
+    """Sign-extend a raw 16-bit register word (branchless)."""
+    return raw - ((raw & 0x8000) << 1)
+
+
+def _to_signed16_bulk(words: list[int]) -> list[int]:
+    """Sign-extend a block of raw 16-bit words in one struct repack."""
+    n = len(words)
+    return list(struct.unpack(f">{n}h", struct.pack(f">{n}H", *words)))
+
+
 # Modbus register map  (address, slave_id, divisor)
 @dataclass(frozen=True)
 class ModbusReg:
@@ -114,17 +140,45 @@ YIELD_REGS = [REG_YIELD_1, REG_YIELD_2, REG_YIELD_3, REG_YIELD_4, REG_YIELD_5]
 # Battery health (BMS)
 REG_BATT_HEALTH = ModbusReg(304, 225, 10)
 
+# Contiguous register groups (start, count, slave) – fetched in one
+# read_input_registers round-trip and sliced, instead of N single reads.
+GROUP_SYS = (840, 21, 100)   # 840..860: BATT_V/POWER/SOC/STATE, PV, CHARGE, DC
+GROUP_AC = (817, 3, 100)     # 817..819: AC loads L1-L3
+
+# All single-register definitions, keyed by (address, slave) so grouped
+# reads can look up the right divisor when slicing a range response.
+_REG_BY_KEY: dict[tuple[int, int], ModbusReg] = {
+    (r.address, r.slave): r
+    for r in (REG_PV_POWER, REG_CHARGE_P, REG_DC_POWER, REG_SOC,
+              REG_BATT_POWER, REG_BATT_STATE, REG_BATT_V,
+              REG_AC1, REG_AC2, REG_AC3, *YIELD_REGS, REG_BATT_HEALTH)
+}
+
 # Relais read addresses (slave 100)
 RELAIS_MULTIPLUS_ADDR = 807   # relaisnr 2 → addr 2+805
 RELAIS_GENERATOR_ADDR = 3500  # relaisnr 3 → addr 3500
 
-# Relais write addresses + slave
-SWITCH_MAP: dict[int, tuple[int, int]] = {
-    # schalter_id: (write_address, slave_id)
-    2: (807, 100),   # Multiplus II
-    3: (3500, 100),  # Generator
+
+@dataclass(frozen=True)
+class SwitchDef:
+    """GPIO pin + Modbus addressing for one toggle switch."""
+    gpio: int
+    read_addr: int
+    write_addr: int
+    slave: int
+
+
+# schalter_id → full switch definition (single source of truth)
+SWITCHES: dict[int, SwitchDef] = {
+    2: SwitchDef(GPIO_MULTIPLUS, RELAIS_MULTIPLUS_ADDR, 807, 100),   # Multiplus II
+    3: SwitchDef(GPIO_GENERATOR, RELAIS_GENERATOR_ADDR, 3500, 100),  # Generator
 }
 
+# Small display lookup tables (one hash lookup instead of a match chain)
+_ON_OFF: dict[int, str] = {1: "AN", 0: "AUS"}
+_BATT_STATE: dict[int, str] = {1: "Laden", 2: "Entl."}
+_SCHALTER_NAME: dict[int, str] = {1: "SCHALTER 1", 2: "Multiplus II", 3: "Generator"}
+
 log = logging.getLogger("cerbo_display")
 
 # ---------------------------------------------------------------------------
@@ -132,35 +186,59 @@ log = logging.getLogger("cerbo_display")
 # ---------------------------------------------------------------------------
 
 def _get_local_subnet() -> str | None:
-    """Get local IP's /24 base (e.g. '192.168.1.')."""
+    """Get local IP's /24 base (e.g. '192.168.1.').
+
+    Uses the connected-UDP-socket trick (no packet is sent) instead of
+    forking `ip route`, so it also works without iproute2 installed."""
     try:
-        out = subprocess.check_output(
-            ["ip", "-4", "route", "get", "1.1.1.1"],
-            timeout=5, text=True
-        )
-        # Parse "src X.X.X.X" from output
-        parts = out.split()
-        for i, part in enumerate(parts):
-            if part == "src" and i + 1 < len(parts):
-                ip = parts[i + 1]
-                pieces = ip.split(".")
-                if len(pieces) == 4:
-                    return ".".join(pieces[:3]) + "."
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            ip = s.getsockname()[0]
+        return ".".join(ip.split(".")[:3]) + "."
     except Exception:
-        pass
-    # Fallback: connect UDP socket
+        return None
+
+
+def _fping_alive(ips: list[str]) -> set[str] | None:
+    """Batch-ping a list of IPs via fping, return the set that answered.
+    Returns None if fping is not installed (caller falls back to full scan)."""
+    if shutil.which("fping") is None:
+        return None
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ".".join(ip.split(".")[:3]) + "."
+        result = subprocess.run(
+            ["fping", "-a", "-q", "-t200", *ips],
+            capture_output=True, text=True, timeout=30,
+        )
+        # fping -a prints one alive IP per line. Exit 1 just means some
+        # hosts were unreachable, but >= 2 is a usage/socket/system error
+        # (e.g. missing cap_net_raw when running as pi) and an empty alive
+        # set from it would wrongly filter discovery down to nothing.
+        if result.returncode >= 2:
+            log.warning("fping failed (exit %d), falling back to full scan",
+                        result.returncode)
+            return None
+        return {line.strip() for line in result.stdout.splitlines() if line.strip()}
     except Exception:
+        log.warning("fping sweep failed, falling back to full scan", exc_info=True)
         return None
 
 
+def _tcp_port_open(ip: str, port: int = 502, timeout: float = 0.2) -> bool:
+    """Cheap TCP connect probe – one RTT, no Modbus framing."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.settimeout(timeout)
+            return s.connect_ex((ip, port)) == 0
+    except Exception:
+        return False
+
+
 def _check_cerbo(ip: str, port: int = 502, timeout: float = 0.3) -> bool:
     """Quick check if ip:port has a Cerbo (Modbus slave 100, register 800)."""
+    # Pre-filter with a raw TCP probe so dead IPs cost one handshake timeout,
+    # not a full Modbus client setup.
+    if not _tcp_port_open(ip, port):
+        return False
     try:
         client = ModbusTcpClient(ip, port=port, timeout=timeout)
         if not client.connect():
@@ -188,62 +266,100 @@ def discover_cerbo(oled_device=None) -> str | None:
         try:
             with canvas(oled_device) as draw:
                 draw.rectangle(oled_device.bounding_box, outline="white")
-                draw.text((5, 10), "Suche Cerbo...", font=ImageFont.truetype(FONT_PATH, 16), fill="white")
-                draw.text((5, 35), subnet + "x", font=ImageFont.truetype(FONT_PATH, 16), fill="white")
+                draw.text((5, 10), "Suche Cerbo...", font=FONT_16, fill="white")
+                draw.text((5, 35), subnet + "x", font=FONT_16, fill="white")
         except Exception:
             pass
 
-    # Try common addresses first
+    # One deduplicated candidate list, common addresses first, submitted to
+    # the pool in a single pass – total wall time is the slowest probe, not
+    # a priority round followed by a full round.
     priority = [1, 65, 100, 200, 2, 10, 50, 150, 254]
-    tried = set()
-    for last in priority:
-        ip = subnet + str(last)
-        tried.add(last)
-        if _check_cerbo(ip):
-            log.info("Cerbo found at %s (priority scan)", ip)
-            return ip
-
-    # Full scan
-    for last in range(1, 255):
-        if last in tried:
-            continue
-        ip = subnet + str(last)
-        if _check_cerbo(ip):
-            log.info("Cerbo found at %s (full scan)", ip)
-            return ip
+    candidates = list(dict.fromkeys(priority + list(range(1, 255))))
+
+    # Ping first, scan later: on sparse networks only a handful of hosts
+    # answer, so the Modbus probes collapse to the alive set.
+    alive = _fping_alive([subnet + str(i) for i in candidates])
+    if alive is not None:
+        log.info("fping sweep: %d host(s) alive", len(alive))
+        candidates = [i for i in candidates if subnet + str(i) in alive]
+
+    found = _scan_batch(subnet, candidates)
+    if found:
+        log.info("Cerbo found at %s", found)
+        return found
 
     log.warning("No Cerbo found on %s0/24", subnet)
     return None
 
 
+def _scan_batch(subnet: str, candidates: list[int]) -> str | None:
+    """Probe a batch of host numbers concurrently, return first Cerbo IP."""
+    with ThreadPoolExecutor(max_workers=64) as ex:
+        futures = {ex.submit(_check_cerbo, subnet + str(i)): i for i in candidates}
+        for fut in as_completed(futures):
+            try:
+                if fut.result():
+                    ip = subnet + str(futures[fut])
+                    ex.shutdown(wait=False, cancel_futures=True)
+                    return ip
+            except Exception:
+                continue
+    return None
+
+
 # ---------------------------------------------------------------------------
-# Fonts (lazy-loaded singleton)
+# I2C serial – single-transaction page writes
 # ---------------------------------------------------------------------------
 
-@dataclass
-class Fonts:
-    """Font cache – loaded once."""
-    _cache: dict[int, ImageFont.FreeTypeFont] = field(default_factory=dict, repr=False)
+class FastI2C:
+    """luma-compatible I2C serial that sends each payload as ONE transaction.
 
-    def get(self, size: int) -> ImageFont.FreeTypeFont:
-        if size not in self._cache:
-            self._cache[size] = ImageFont.truetype(FONT_PATH, size)
-        return self._cache[size]
+    The stock luma i2c serial splits framebuffer data into 32-byte
+    write_i2c_block_data chunks, each prefixed with the 0x40 control byte
+    and its own START/STOP. Using smbus2's i2c_rdwr, a full 128-byte SH1106
+    page goes out as a single message, cutting bus overhead per refresh.
+    Combine with dtparam=i2c_arm_baudrate=400000 (see setup.sh).
+    """
 
-    @property
-    def f10(self) -> ImageFont.FreeTypeFont:
-        return self.get(12)
+    def __init__(self, port: int = I2C_PORT, address: int = I2C_ADDRESS) -> None:
+        self._bus = SMBus(port)
+        self._addr = address
 
-    @property
-    def f12(self) -> ImageFont.FreeTypeFont:
-        return self.get(16)
+    def command(self, *cmd: int) -> None:
+        self._bus.i2c_rdwr(i2c_msg.write(self._addr, bytes([0x00, *cmd])))
 
-    @property
-    def f16(self) -> ImageFont.FreeTypeFont:
-        return self.get(16)
+    def data(self, data: list[int]) -> None:
+        self._bus.i2c_rdwr(i2c_msg.write(self._addr, bytes([0x40]) + bytes(data)))
+
+    def cleanup(self) -> None:
+        try:
+            self._bus.close()
+        except Exception:
+            pass
 
 
-fonts = Fonts()
+def _make_serial() -> Any:
+    """Fast smbus2 serial if available, else the stock luma i2c."""
+    if SMBus is not None:
+        try:
+            return FastI2C()
+        except Exception:
+            log.warning("smbus2 serial init failed, using luma i2c", exc_info=True)
+    return i2c(port=I2C_PORT, address=I2C_ADDRESS)
+
+
+# ---------------------------------------------------------------------------
+# Fonts (loaded once at import)
+# ---------------------------------------------------------------------------
+
+# Module-level constants instead of per-draw property lookups. The screens
+# all render at size 16 (the old fonts.f12 property also returned size 16).
+try:
+    FONT_12 = ImageFont.truetype(FONT_PATH, 12)
+    FONT_16 = ImageFont.truetype(FONT_PATH, 16)
+except Exception:  # pragma: no cover - font missing (e.g. stripped checkout)
+    FONT_12 = FONT_16 = ImageFont.load_default()
 
 # ---------------------------------------------------------------------------
 # CerboModbus – persistent connection with auto-reconnect
@@ -252,15 +368,21 @@ fonts = Fonts()
 class CerboModbus:
     """Persistent Modbus TCP connection to Victron Cerbo GX."""
 
-    def __init__(self, host: str | None = CERBO_HOST, port: int = CERBO_PORT) -> None:
+    def __init__(self, host: str | None = CERBO_HOST, port: int = CERBO_PORT,
+                 ttl_s: float = 0.2) -> None:
         if host is None:
             raise ValueError("No Cerbo host configured – run discovery first")
         self._host = host
         self._port = port
+        self._ttl_s = ttl_s
         self._client = ModbusTcpClient(host, port=port, timeout=CERBO_TIMEOUT)
         self._connected = False
         self._last_success: float = time.monotonic()
-        self._cache: dict[tuple[int, int], float] = {}
+        # Serializes wire access – the client is shared between the poller
+        # thread and the main loop (switch reads/writes).
+        self._io_lock = threading.Lock()
+        # (address, slave) → (value, monotonic timestamp of the read)
+        self._cache: dict[tuple[int, int], tuple[float, float]] = {}
         self._fail_count: dict[tuple[int, int], int] = {}
         self._blacklist: dict[tuple[int, int], float] = {}
 
@@ -279,6 +401,7 @@ class CerboModbus:
         try:
             self._connected = self._client.connect()
             if self._connected:
+                self._enable_keepalive()
                 log.info("Modbus connected to %s:%d", self._host, self._port)
             return self._connected
         except Exception:
@@ -286,51 +409,106 @@ class CerboModbus:
             self._connected = False
             return False
 
+    def _enable_keepalive(self) -> None:
+        """Turn on TCP keepalive so idle connections survive the Cerbo's
+        idle-drop window instead of paying a fresh handshake per poll."""
+        sock = getattr(self._client, "socket", None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Probe after 30s idle, every 10s, give up after 3 misses (Linux).
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except Exception:
+            log.debug("Could not set TCP keepalive options", exc_info=True)
+
     def read_register(self, reg: ModbusReg) -> float | None:
         """Read a single input register. Returns scaled value or None on error.
-        Blacklists registers that fail 3+ times (retries after 5 min)."""
+        Blacklists registers that fail 3+ times (retries after 5 min).
+        Values younger than ttl_s are served from cache without touching
+        the wire, so repeated reads within one frame cost nothing."""
         key = (reg.address, reg.slave)
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[1] < self._ttl_s:
+            return entry[0]
         # Skip blacklisted registers (retry after 300s)
         bl_time = self._blacklist.get(key)
         if bl_time is not None:
             if time.monotonic() - bl_time < 300:
                 return self._cached(reg)
             else:
-                del self._blacklist[key]
+                # pop, not del: poller and main loop can both expire the
+                # same key concurrently, the loser must not raise.
+                self._blacklist.pop(key, None)
                 self._fail_count.pop(key, None)
                 log.info("Retrying previously blacklisted reg %d slave %d",
                          reg.address, reg.slave)
-        if not self._ensure_connected():
-            return self._cached(reg)
-        try:
-            result = self._client.read_input_registers(
-                reg.address, count=1, device_id=reg.slave
-            )
-            if result.isError():
-                self._fail_count[key] = self._fail_count.get(key, 0) + 1
-                if self._fail_count[key] >= 3:
-                    log.warning("Blacklisting reg %d slave %d after %d failures "
-                                "(retry in 5 min)",
-                                reg.address, reg.slave, self._fail_count[key])
-                    self._blacklist[key] = time.monotonic()
-                else:
-                    log.warning("Modbus read error reg %d slave %d (%d/3): %s",
-                                reg.address, reg.slave, self._fail_count[key], result)
+        with self._io_lock:
+            if not self._ensure_connected():
                 return self._cached(reg)
-            raw = result.registers[0]
-            # Signed 16-bit conversion (original: if value > 60000)
-            if raw > 60000:
-                raw -= 65536
-            value = raw / reg.divisor
-            self._last_success = time.monotonic()
-            self._cache[key] = value
-            self._fail_count.pop(key, None)  # reset on success
-            return value
-        except Exception:
-            log.warning("Modbus read exception reg %d slave %d",
-                        reg.address, reg.slave, exc_info=True)
-            self._mark_disconnected()
-            return self._cached(reg)
+            try:
+                result = self._client.read_input_registers(
+                    reg.address, count=1, device_id=reg.slave
+                )
+                if result.isError():
+                    self._fail_count[key] = self._fail_count.get(key, 0) + 1
+                    if self._fail_count[key] >= 3:
+                        log.warning("Blacklisting reg %d slave %d after %d "
+                                    "failures (retry in 5 min)",
+                                    reg.address, reg.slave, self._fail_count[key])
+                        self._blacklist[key] = time.monotonic()
+                    else:
+                        log.warning("Modbus read error reg %d slave %d (%d/3): %s",
+                                    reg.address, reg.slave, self._fail_count[key], result)
+                    return self._cached(reg)
+                # The old `> 60000` cutoff mis-classified values in
+                # [32768, 60000] as positive.
+                value = _to_signed16(result.registers[0]) / reg.divisor
+                self._last_success = time.monotonic()
+                self._cache[key] = (value, self._last_success)
+                self._fail_count.pop(key, None)  # reset on success
+                return value
+            except Exception:
+                log.warning("Modbus read exception reg %d slave %d",
+                            reg.address, reg.slave, exc_info=True)
+                self._mark_disconnected()
+                return self._cached(reg)
+
+    def read_range(self, start: int, count: int, slave: int) -> list[int] | None:
+        """Read a contiguous block of input registers in one round-trip.
+        Returns raw (signed 16-bit) values, or None on any error – callers
+        fall back to per-register reads."""
+        with self._io_lock:
+            if not self._ensure_connected():
+                return None
+            try:
+                result = self._client.read_input_registers(
+                    start, count=count, device_id=slave
+                )
+                if result.isError():
+                    log.warning("Modbus range read error %d+%d slave %d: %s",
+                                start, count, slave, result)
+                    return None
+                self._last_success = time.monotonic()
+                return _to_signed16_bulk(result.registers)
+            except Exception:
+                log.warning("Modbus range read exception %d+%d slave %d",
+                            start, count, slave, exc_info=True)
+                self._mark_disconnected()
+                return None
+
+    def read_many(self, regs: list[ModbusReg]) -> list[float | None]:
+        """Read several (non-adjacent) registers back-to-back.
+
+        Plain sequential reads: the synchronous client cannot interleave
+        requests on one socket and every read holds the I/O lock, so a
+        thread pool here would add overhead without any overlap. Real
+        pipelining would need per-request connections or the async client."""
+        return [self.read_register(reg) for reg in regs]
 
     def read_relais(self, relais_addr: int, slave: int = 100) -> int | None:
         """Read a relay status register. Returns int value or None."""
@@ -342,21 +520,24 @@ class CerboModbus:
 
     def write_register(self, address: int, slave: int, value: int) -> bool:
         """Write a single holding register."""
-        if not self._ensure_connected():
-            return False
-        try:
-            result = self._client.write_register(address, value, device_id=slave)
-            if result.isError():
-                log.error("Modbus write error addr %d slave %d: %s",
-                          address, slave, result)
+        with self._io_lock:
+            if not self._ensure_connected():
+                return False
+            try:
+                result = self._client.write_register(address, value, device_id=slave)
+                if result.isError():
+                    log.error("Modbus write error addr %d slave %d: %s",
+                              address, slave, result)
+                    return False
+                self._last_success = time.monotonic()
+                # Drop any cached read so the next poll sees the new state.
+                self._cache.pop((address, slave), None)
+                log.info("Modbus write addr=%d slave=%d val=%d OK", address, slave, value)
+                return True
+            except Exception:
+                log.error("Modbus write exception", exc_info=True)
+                self._mark_disconnected()
                 return False
-            self._last_success = time.monotonic()
-            log.info("Modbus write addr=%d slave=%d val=%d OK", address, slave, value)
-            return True
-        except Exception:
-            log.error("Modbus write exception", exc_info=True)
-            self._mark_disconnected()
-            return False
 
     def close(self) -> None:
         try:
@@ -367,7 +548,8 @@ class CerboModbus:
 
     def _cached(self, reg: ModbusReg) -> float | None:
         """Return last known value for this register, or None."""
-        return self._cache.get((reg.address, reg.slave))
+        entry = self._cache.get((reg.address, reg.slave))
+        return entry[0] if entry is not None else None
 
     def _mark_disconnected(self) -> None:
         self._connected = False
@@ -377,6 +559,71 @@ class CerboModbus:
             pass
 
 
+# ---------------------------------------------------------------------------
+# ModbusPoller – background polling thread
+# ---------------------------------------------------------------------------
+
+class ModbusPoller(threading.Thread):
+    """Polls all display registers in the background at ~1 Hz.
+
+    The main loop and OledDisplay read from snapshot() without ever
+    blocking on the wire, so the display stays responsive during Modbus
+    stalls and reconnects."""
+
+    def __init__(self, modbus: CerboModbus, interval_s: float = 1.0) -> None:
+        super().__init__(name="modbus-poller", daemon=True)
+        self._modbus = modbus
+        self._interval = interval_s
+        self._lock = threading.Lock()
+        self._values: dict[tuple[int, int], float] = {}
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self._poll_once()
+            except Exception:
+                log.warning("Poller iteration failed", exc_info=True)
+            self._stop_event.wait(self._interval)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def snapshot(self) -> dict[tuple[int, int], float]:
+        """Latest known values, keyed by (address, slave)."""
+        with self._lock:
+            return self._values.copy()
+
+    def get(self, address: int, slave: int) -> float | None:
+        with self._lock:
+            return self._values.get((address, slave))
+
+    def _poll_once(self) -> None:
+        values: dict[tuple[int, int], float] = {}
+        # Contiguous blocks first – one round-trip each.
+        for start, count, slave in (GROUP_SYS, GROUP_AC):
+            raws = self._modbus.read_range(start, count, slave)
+            if raws is None:
+                continue
+            for offset, raw in enumerate(raws):
+                key = (start + offset, slave)
+                reg = _REG_BY_KEY.get(key)
+                if reg is not None:
+                    values[key] = raw / reg.divisor
+        # Stragglers on other slaves.
+        stragglers = [*YIELD_REGS, REG_BATT_HEALTH]
+        for reg, val in zip(stragglers, self._modbus.read_many(stragglers)):
+            if val is not None:
+                values[(reg.address, reg.slave)] = val
+        # Relay states for the overview screen.
+        for addr in (RELAIS_MULTIPLUS_ADDR, RELAIS_GENERATOR_ADDR):
+            val = self._modbus.read_relais(addr)
+            if val is not None:
+                values[(addr, 100)] = val
+        with self._lock:
+            self._values.update(values)
+
+
 # ---------------------------------------------------------------------------
 # OledDisplay – all rendering
 # ---------------------------------------------------------------------------
@@ -384,11 +631,42 @@ class CerboModbus:
 class OledDisplay:
     """SH1106 OLED display rendering (128×64)."""
 
-    def __init__(self, modbus: CerboModbus) -> None:
-        serial = i2c(port=I2C_PORT, address=I2C_ADDRESS)
+    # Pre-bound str.format templates: the parsed format spec is cached on
+    # the string object, so per-frame rendering reuses it instead of
+    # re-parsing a literal each call.
+    _TPL_PV = "PV: {} W ".format
+    _TPL_SOC = "SOC: {} % ".format
+    _TPL_BATT = "{} {} W ".format
+    _TPL_MP = "MP: {}".format
+    _TPL_GEN = "G: {}".format
+    _TPL_ERTRAG = "Ertrag: {:.1f} kWh".format
+    _TPL_SOC2 = "SoC: {} % ".format
+    _TPL_BATT2 = "{}: {} W ".format
+    _TPL_AC = "AC Last: {} W ".format
+    _TPL_SOH = "SoH: {} % ".format
+    _TPL_STAMP = "{} Uhr".format
+    _TPL_HEUTE = "heute: {:.1f} h".format
+    _TPL_MORGEN = "morgen: {:.1f} h".format
+    _TPL_UEBERM = "überm: {:.1f} h".format
+
+    def __init__(self, modbus: CerboModbus,
+                 poller: ModbusPoller | None = None) -> None:
+        serial = _make_serial()
         self._device = sh1106(serial, rotate=DISPLAY_ROTATE)
         self._modbus = modbus
-        self._last_frame: dict[str, Any] = {}
+        self._poller = poller
+        # (screen_id, value tuple) of the frame currently on the panel –
+        # used to skip the I2C upload when nothing changed.
+        self._last_frame: tuple[str, tuple] | None = None
+        self._frame_cache: dict[tuple[int, int], float] = {}
+        # Persistent framebuffer for the switch screens, whose body is
+        # static while the clock ticks – lets us repaint just the clock
+        # strip instead of the whole panel each second.
+        self._fb = Image.new("1", self._device.size)
+        self._schalter_key: tuple | None = None
+        # Body of the current switch screen without the clock – clock-only
+        # updates composite onto a copy of this instead of erasing pixels.
+        self._schalter_body: Image.Image | None = None
 
     @property
     def device(self) -> sh1106:
@@ -406,19 +684,65 @@ class OledDisplay:
             now.hour,
         )
 
+    def _prefetch(self, *groups: tuple[int, int, int]) -> None:
+        """Fill the per-frame cache from one range read per group.
+        Registers missing from the cache fall back to single reads.
+        With a background poller attached, the snapshot replaces the wire
+        reads entirely and this never blocks."""
+        self._frame_cache.clear()
+        if self._poller is not None:
+            self._frame_cache.update(self._poller.snapshot())
+            return
+        for start, count, slave in groups:
+            raws = self._modbus.read_range(start, count, slave)
+            if raws is None:
+                continue
+            for offset, raw in enumerate(raws):
+                key = (start + offset, slave)
+                reg = _REG_BY_KEY.get(key)
+                if reg is not None:
+                    self._frame_cache[key] = raw / reg.divisor
+
+    def _frame_unchanged(self, screen_id: str, frame_key: tuple) -> bool:
+        """Dirty flag: True if this exact frame is already on the panel."""
+        if self._last_frame == (screen_id, frame_key):
+            return True
+        self._last_frame = (screen_id, frame_key)
+        self._schalter_key = None  # full repaint replaces any overlay frame
+        return False
+
     def _read(self, reg: ModbusReg) -> float:
-        """Read register, return 0 if None (display-safe)."""
+        """Read register, return 0 if None (display-safe).
+        Served from the per-frame prefetch cache when possible."""
+        cached = self._frame_cache.get((reg.address, reg.slave))
+        if cached is not None:
+            return cached
         val = self._modbus.read_register(reg)
         return val if val is not None else 0
 
     def _read_relais_status(self, addr: int) -> int | None:
+        if self._poller is not None:
+            val = self._poller.get(addr, 100)
+            if val is not None:
+                return int(val)
         return self._modbus.read_relais(addr)
 
-    @staticmethod
-    def _read_sun_file(path: str, chars: int = 2) -> str:
-        """Read sunshine-hours file, return '?' on error."""
+    # path → (mtime, stripped contents); the files change every 2h via cron,
+    # so one stat per frame replaces an open/read/close per file.
+    _SUN_FILE_CACHE: dict[str, tuple[float, str]] = {}
+
+    @classmethod
+    def _read_sun_file(cls, path: str, chars: int = 2) -> str:
+        """Read sunshine-hours file (mtime-cached), return '?' on error."""
         try:
-            return Path(path).read_text().strip()[:chars] if chars == 2 else Path(path).read_text().strip()
+            mtime = os.stat(path).st_mtime
+            entry = cls._SUN_FILE_CACHE.get(path)
+            if entry is not None and entry[0] == mtime:
+                text = entry[1]
+            else:
+                text = Path(path).read_text().strip()
+                cls._SUN_FILE_CACHE[path] = (mtime, text)
+            return text[:chars] if chars == 2 else text
         except FileNotFoundError:
             log.warning("Sun file not found: %s", path)
             return "?"
@@ -431,80 +755,78 @@ class OledDisplay:
     def display_start(self) -> None:
         """Screen 0: Overview."""
         today_date, today_time, _ = self._now()
+        self._prefetch(GROUP_SYS)
 
-        mp_val = self._read_relais_status(RELAIS_MULTIPLUS_ADDR)
-        match mp_val:
-            case 1:   multiplus = "AN"
-            case 0:   multiplus = "AUS"
-            case _:    multiplus = "??"
-
-        gen_val = self._read_relais_status(RELAIS_GENERATOR_ADDR)
-        match gen_val:
-            case 1:   genset = "AN"
-            case 0:   genset = "AUS"
-            case _:    genset = "??"
+        multiplus = _ON_OFF.get(self._read_relais_status(RELAIS_MULTIPLUS_ADDR), "??")
+        genset = _ON_OFF.get(self._read_relais_status(RELAIS_GENERATOR_ADDR), "??")
 
         pvpower = self._read(REG_PV_POWER)
         soc = format(self._read(REG_SOC), ".0f")
         battstate = self._read(REG_BATT_STATE)
 
-        match int(battstate):
-            case 1:
-                battstatus = "Laden "
-                battp: Any = self._read(REG_BATT_POWER)
-            case 2:
-                battstatus = "Entl. "
-                battp = self._read(REG_BATT_POWER)
-            case _:
-                battstatus = "IDLE "
-                battp = "0"
+        battstatus = _BATT_STATE.get(int(battstate))
+        if battstatus is not None:
+            battp: Any = self._read(REG_BATT_POWER)
+        else:
+            battstatus, battp = "IDLE", "0"
+
+        if self._frame_unchanged("start", (pvpower, soc, battstatus, battp,
+                                           multiplus, genset)):
+            return
 
         with canvas(self._device) as draw:
             draw.rectangle(self._device.bounding_box, outline="white")
-            draw.text((5, 0), "PV: " + str(pvpower) + " W ", font=fonts.f12, fill="white")
-            draw.text((5, 16), "SOC: " + str(soc) + " % ", font=fonts.f12, fill="white")
-            draw.text((5, 32), battstatus + str(battp) + " W ", font=fonts.f12, fill="white")
-            draw.text((5, 48), "MP: " + multiplus, font=fonts.f12, fill="white")
-            draw.text((74, 48), "G: " + genset, font=fonts.f12, fill="white")
+            draw.text((5, 0), self._TPL_PV(pvpower), font=FONT_16, fill="white")
+            draw.text((5, 16), self._TPL_SOC(soc), font=FONT_16, fill="white")
+            draw.text((5, 32), self._TPL_BATT(battstatus, battp), font=FONT_16, fill="white")
+            draw.text((5, 48), self._TPL_MP(multiplus), font=FONT_16, fill="white")
+            draw.text((74, 48), self._TPL_GEN(genset), font=FONT_16, fill="white")
 
     def display_victron_pv(self) -> None:
         """Screen 1: PV Detail."""
         _, today_time, _ = self._now()
+        self._prefetch(GROUP_SYS)
 
         pvpower = self._read(REG_PV_POWER)
-        yieldtoday = sum(self._read(r) for r in YIELD_REGS)
+        if self._poller is None:
+            yieldtoday = sum(v or 0 for v in self._modbus.read_many(YIELD_REGS))
+        else:
+            yieldtoday = sum(self._read(r) for r in YIELD_REGS)
+
+        if self._frame_unchanged("pv", (pvpower, yieldtoday)):
+            return
 
         with canvas(self._device) as draw:
             draw.rectangle(self._device.bounding_box, outline="white")
-            draw.text((5, 0), "PV: " + str(pvpower) + " W ", font=fonts.f12, fill="white")
-            draw.text((5, 20), "Ertrag: " + format(yieldtoday, ".1f") + " kWh", font=fonts.f12, fill="white")
+            draw.text((5, 0), self._TPL_PV(pvpower), font=FONT_16, fill="white")
+            draw.text((5, 20), self._TPL_ERTRAG(yieldtoday), font=FONT_16, fill="white")
 
     def display_batterie(self) -> None:
         """Screen 2: Battery."""
         _, today_time, _ = self._now()
+        self._prefetch(GROUP_SYS, GROUP_AC)
 
         soc = format(self._read(REG_SOC), ".0f")
         battstate = self._read(REG_BATT_STATE)
         batthealth = self._read(REG_BATT_HEALTH)
         acpower = self._read(REG_AC1) + self._read(REG_AC2) + self._read(REG_AC3)
 
-        match int(battstate):
-            case 1:
-                battstatus = "Laden"
-                battp: Any = self._read(REG_BATT_POWER)
-            case 2:
-                battstatus = "Entl."
-                battp = self._read(REG_BATT_POWER)
-            case _:
-                battstatus = "IDLE"
-                battp = "0"
+        battstatus = _BATT_STATE.get(int(battstate))
+        if battstatus is not None:
+            battp: Any = self._read(REG_BATT_POWER)
+        else:
+            battstatus, battp = "IDLE", "0"
+
+        if self._frame_unchanged("batterie", (soc, battstatus, battp,
+                                              acpower, batthealth)):
+            return
 
         with canvas(self._device) as draw:
             draw.rectangle(self._device.bounding_box, outline="white")
-            draw.text((5, 0), "SoC: " + str(soc) + " % ", font=fonts.f12, fill="white")
-            draw.text((5, 16), str(battstatus) + ": " + str(battp) + " W ", font=fonts.f12, fill="white")
-            draw.text((5, 32), "AC Last: " + str(acpower) + " W ", font=fonts.f12, fill="white")
-            draw.text((5, 48), "SoH: " + str(batthealth) + " % ", font=fonts.f12, fill="white")
+            draw.text((5, 0), self._TPL_SOC2(soc), font=FONT_16, fill="white")
+            draw.text((5, 16), self._TPL_BATT2(battstatus, battp), font=FONT_16, fill="white")
+            draw.text((5, 32), self._TPL_AC(acpower), font=FONT_16, fill="white")
+            draw.text((5, 48), self._TPL_SOH(batthealth), font=FONT_16, fill="white")
 
     def display_wetter(self) -> None:
         """Screen 3: Weather / sunshine hours."""
@@ -526,66 +848,128 @@ class OledDisplay:
 
         stamp = self._read_sun_file(datum_path, chars=99)
 
+        if self._frame_unchanged("wetter", (stamp, sonneheute, sonnemorgen,
+                                            sonneuebermorgen)):
+            return
+
         with canvas(self._device) as draw:
             draw.rectangle(self._device.bounding_box, outline="white")
-            draw.text((5, 0), str(stamp.strip()) + " Uhr", font=fonts.f12, fill="white")
-            draw.text((5, 16), "heute: " + format(float(sonneheute.strip() or 0), ".1f") + " h", font=fonts.f12, fill="white")
-            draw.text((5, 32), "morgen: " + format(float(sonnemorgen.strip() or 0), ".1f") + " h", font=fonts.f12, fill="white")
-            draw.text((5, 48), "überm: " + format(float(sonneuebermorgen.strip() or 0), ".1f") + " h", font=fonts.f12, fill="white")
+            draw.text((5, 0), self._TPL_STAMP(stamp.strip()), font=FONT_16, fill="white")
+            draw.text((5, 16), self._TPL_HEUTE(float(sonneheute.strip() or 0)), font=FONT_16, fill="white")
+            draw.text((5, 32), self._TPL_MORGEN(float(sonnemorgen.strip() or 0)), font=FONT_16, fill="white")
+            draw.text((5, 48), self._TPL_UEBERM(float(sonneuebermorgen.strip() or 0)), font=FONT_16, fill="white")
 
     def display_lan_error(self) -> None:
         """Show LAN error screen."""
+        if self._frame_unchanged("lan_error", ()):
+            return
         with canvas(self._device) as draw:
             draw.rectangle(self._device.bounding_box, outline="white")
-            draw.text((5, 5), "LAN-Kabel ", font=fonts.f12, fill="white")
-            draw.text((5, 19), "einstecken oder ", font=fonts.f12, fill="white")
-            draw.text((5, 31), "CERBO mit ", font=fonts.f12, fill="white")
-            draw.text((5, 41), "LAN verbinden! ", font=fonts.f12, fill="white")
+            draw.text((5, 5), "LAN-Kabel ", font=FONT_16, fill="white")
+            draw.text((5, 19), "einstecken oder ", font=FONT_16, fill="white")
+            draw.text((5, 31), "CERBO mit ", font=FONT_16, fill="white")
+            draw.text((5, 41), "LAN verbinden! ", font=FONT_16, fill="white")
+
+    # The time string at (75, 3) rendered at size 16 stays inside rows
+    # 0..23 – the page span pushed by clock-only updates.
+    _CLOCK_ROWS = (0, 24)
+
+    def _push_region(self, y0: int, y1: int) -> None:
+        """Upload only the SH1106 pages covering framebuffer rows y0..y1-1.
+
+        Handles the 0°/180° rotations this display ships with; anything
+        else falls back to a full display() upload."""
+        dev = self._device
+        if DISPLAY_ROTATE == 2:
+            img = self._fb.rotate(180)
+            y0, y1 = dev.height - y1, dev.height - y0
+        elif DISPLAY_ROTATE == 0:
+            img = self._fb
+        else:
+            dev.display(self._fb)
+            return
+        pix = img.load()
+        for page in range(y0 // 8, (y1 + 7) // 8):
+            # SH1106 RAM is 132 columns wide; visible area starts at col 2.
+            dev.command(0xB0 | page, 0x02, 0x10)
+            base = page * 8
+            buf = bytearray(dev.width)
+            for x in range(dev.width):
+                b = 0
+                for bit in range(8):
+                    if pix[x, base + bit]:
+                        b |= 1 << bit
+                buf[x] = b
+            dev.data(list(buf))
+
+    def _draw_clock_overlay(self, time_str: str) -> None:
+        """Repaint just the clock strip and push its pages (~3 of 8).
+
+        Starts from a pristine copy of the clock-less body so the frame
+        border and any body text reaching into the strip stay intact."""
+        self._fb = self._schalter_body.copy()
+        draw = ImageDraw.Draw(self._fb)
+        draw.text((75, 3), time_str, font=FONT_16, fill="yellow")
+        self._push_region(*self._CLOCK_ROWS)
+
+    def _display_schalter_frame(self, key: tuple, time_str: str,
+                                lines: list[tuple[tuple[int, int], str, str]]) -> None:
+        """Render a switch screen with a live clock into the persistent
+        framebuffer. If only the clock changed since the last call, push
+        just the clock pages instead of the full frame."""
+        if self._schalter_key == key and self._schalter_body is not None:
+            self._draw_clock_overlay(time_str)
+            return
+        self._schalter_key = key
+        self._last_frame = None  # force next data screen to repaint fully
+
+        self._fb = Image.new("1", self._device.size)
+        draw = ImageDraw.Draw(self._fb)
+        draw.rectangle(self._device.bounding_box, outline="white")
+        for pos, text, color in lines:
+            draw.text(pos, text, font=FONT_16, fill=color)
+        # Everything except the clock – the overlay restores from this.
+        self._schalter_body = self._fb.copy()
+        draw.text((75, 3), time_str, font=FONT_16, fill="yellow")
+        self._device.display(self._fb)
 
     def display_schalter_umschalten(self, relaisnr: int, status: int) -> None:
         """Show switch confirmation prompt."""
         today_date, today_time, _ = self._now()
 
-        match relaisnr:
-            case 1:  schalter = "SCHALTER 1:"
-            case 2:  schalter = "Multiplus II:"
-            case 3:  schalter = "Generator:"
-            case _:  schalter = "?"
-
+        schalter = _SCHALTER_NAME.get(relaisnr, "?") + ":"
         zustand = " AN" if status == 1 else " AUS"
 
-        with canvas(self._device) as draw:
-            draw.rectangle(self._device.bounding_box, outline="white")
-            draw.text((75, 3), today_time, font=fonts.f12, fill="yellow")
-            draw.text((5, 12), "UMSCHALTEN:", font=fonts.f12, fill="yellow")
-            draw.text((5, 28), schalter + zustand, font=fonts.f12, fill="white")
-            draw.text((5, 44), "..TASTER..in 5 Sek.!", font=fonts.f12, fill="white")
+        self._display_schalter_frame(
+            ("umschalten", relaisnr, status), today_time,
+            [((5, 12), "UMSCHALTEN:", "yellow"),
+             ((5, 28), f"{schalter}{zustand}", "white"),
+             ((5, 44), "..TASTER..in 5 Sek.!", "white")],
+        )
 
     def display_schalter_start(self, relaisnr: int) -> None:
         """Show switch initialization screen."""
         today_date, today_time, _ = self._now()
 
-        match relaisnr:
-            case 1:  schalter = "SCHALTER 1"
-            case 2:  schalter = "Multiplus II"
-            case 3:  schalter = "Generator"
-            case _:  schalter = "?"
+        schalter = _SCHALTER_NAME.get(relaisnr, "?")
 
-        with canvas(self._device) as draw:
-            draw.rectangle(self._device.bounding_box, outline="white")
-            draw.text((75, 3), today_time, font=fonts.f12, fill="yellow")
-            draw.text((2, 12), "INITIALISIERUNG", font=fonts.f12, fill="yellow")
-            draw.text((2, 28), schalter, font=fonts.f12, fill="white")
-            draw.text((2, 44), "bitte umschalten", font=fonts.f12, fill="white")
+        self._display_schalter_frame(
+            ("start", relaisnr), today_time,
+            [((2, 12), "INITIALISIERUNG", "yellow"),
+             ((2, 28), schalter, "white"),
+             ((2, 44), "bitte umschalten", "white")],
+        )
 
     def display_schalter_abgebrochen(self) -> None:
         """Show 'switch cancelled' screen for 2 seconds."""
+        self._last_frame = None
+        self._schalter_key = None
         with canvas(self._device) as draw:
             draw.rectangle(self._device.bounding_box, outline="white")
-            draw.text((5, 5), "Vorgang ", font=fonts.f12, fill="white")
-            draw.text((5, 19), "abgebrochen, ", font=fonts.f12, fill="white")
-            draw.text((5, 31), "nicht ", font=fonts.f12, fill="white")
-            draw.text((5, 41), "geschaltet! ", font=fonts.f12, fill="white")
+            draw.text((5, 5), "Vorgang ", font=FONT_16, fill="white")
+            draw.text((5, 19), "abgebrochen, ", font=FONT_16, fill="white")
+            draw.text((5, 31), "nicht ", font=FONT_16, fill="white")
+            draw.text((5, 41), "geschaltet! ", font=FONT_16, fill="white")
         time.sleep(2)
 
     def show_screen(self, index: int) -> None:
@@ -605,7 +989,12 @@ class OledDisplay:
 # ---------------------------------------------------------------------------
 
 class SwitchController:
-    """Manages toggle switches and the screen-cycle pushbutton via gpiozero."""
+    """Manages toggle switches and the screen-cycle pushbutton.
+
+    The toggle switches are level-polled every loop iteration, so they are
+    read through libgpiod directly (much cheaper per read than gpiozero's
+    object graph); gpiozero stays for the pushbutton's event callback.
+    Falls back to gpiozero for the switches if gpiod is unavailable."""
 
     def __init__(self, modbus: CerboModbus, display: OledDisplay) -> None:
         self._modbus = modbus
@@ -613,11 +1002,32 @@ class SwitchController:
         self._counter: int = 0
         self._tick: int = 0
 
-        # gpiozero Buttons (pull_up=True is default, active_state matches original logic)
-        self._sw_generator = Button(GPIO_GENERATOR, pull_up=True, bounce_time=None)
-        self._sw_multiplus = Button(GPIO_MULTIPLUS, pull_up=True, bounce_time=None)
-        self._btn = Button(GPIO_BUTTON, pull_up=True, bounce_time=BUTTON_BOUNCE_S)
+        # Toggle switches: prefer raw gpiod line reads
+        self._gpiod_lines = None
+        if gpiod is not None:
+            try:
+                self._gpiod_lines = gpiod.request_lines(
+                    "/dev/gpiochip0",
+                    consumer="cerbo_display",
+                    config={
+                        (GPIO_GENERATOR, GPIO_MULTIPLUS): gpiod.LineSettings(
+                            direction=Direction.INPUT, bias=Bias.PULL_UP
+                        ),
+                    },
+                )
+            except Exception:
+                log.warning("gpiod line request failed, using gpiozero for "
+                            "switches", exc_info=True)
+
+        self._switch_buttons: dict[int, Button] = {}
+        if self._gpiod_lines is None:
+            # gpiozero fallback (pull_up=True matches original logic)
+            self._switch_buttons = {
+                GPIO_GENERATOR: Button(GPIO_GENERATOR, pull_up=True, bounce_time=None),
+                GPIO_MULTIPLUS: Button(GPIO_MULTIPLUS, pull_up=True, bounce_time=None),
+            }
 
+        self._btn = Button(GPIO_BUTTON, pull_up=True, bounce_time=BUTTON_BOUNCE_S)
         self._btn.when_pressed = self._on_button_press
 
     @property
@@ -646,35 +1056,19 @@ class SwitchController:
 
     def read_switch(self, gpio: int) -> int:
         """Read physical switch state (1=pressed/high, 0=low)."""
-        match gpio:
-            case _ if gpio == GPIO_GENERATOR:
-                return int(self._sw_generator.is_pressed)
-            case _ if gpio == GPIO_MULTIPLUS:
-                return int(self._sw_multiplus.is_pressed)
-            case _:
-                return 0
-
-    def _relais_addr_for(self, schalter_id: int) -> int:
-        """Map schalter id to relay read address."""
-        if schalter_id == 3:
-            return RELAIS_GENERATOR_ADDR
-        return schalter_id + 805
-
-    def _gpio_for(self, schalter_id: int) -> int:
-        if schalter_id == 3:
-            return GPIO_GENERATOR
-        if schalter_id == 2:
-            return GPIO_MULTIPLUS
-        return GPIO_GENERATOR  # schalter 1 mapped to SCHALTER1 in original
+        if self._gpiod_lines is not None:
+            # Pull-up input: line INACTIVE (grounded) == switch closed,
+            # same polarity as gpiozero's is_pressed with pull_up=True.
+            return int(self._gpiod_lines.get_value(gpio) == Value.INACTIVE)
+        btn = self._switch_buttons.get(gpio)
+        return int(btn.is_pressed) if btn is not None else 0
 
     def check_switch(self, schalter_id: int) -> None:
         """Check if a toggle switch changed vs. Cerbo relay state, do 5s confirm."""
-        gpio = self._gpio_for(schalter_id)
-        write_addr, write_slave = SWITCH_MAP.get(schalter_id, (0, 100))
-        relais_addr = self._relais_addr_for(schalter_id)
+        sw = SWITCHES[schalter_id]
 
-        current_switch = self.read_switch(gpio)
-        relay_state = self._modbus.read_relais(relais_addr)
+        current_switch = self.read_switch(sw.gpio)
+        relay_state = self._modbus.read_relais(sw.read_addr)
 
         if relay_state is None:
             return  # can't compare, skip
@@ -685,12 +1079,13 @@ class SwitchController:
         log.info("Switch %d toggled – waiting 5s for confirmation", schalter_id)
         desired = current_switch
         self._display.display_schalter_umschalten(schalter_id, desired)
-        counter_before = self._counter
-        time.sleep(SWITCH_CONFIRM_S)
+        # Event-driven wait: returns as soon as the button is pressed instead
+        # of always blocking the full confirmation window.
+        confirmed = self._btn.wait_for_press(timeout=SWITCH_CONFIRM_S)
 
         # Verify switch still in same position AND button was pressed during wait
-        if self.read_switch(gpio) == desired and self._counter > counter_before:
-            self._modbus.write_register(write_addr, write_slave, desired)
+        if confirmed and self.read_switch(sw.gpio) == desired:
+            self._modbus.write_register(sw.write_addr, sw.slave, desired)
             self._counter = 0
         else:
             self._display.display_schalter_abgebrochen()
@@ -699,23 +1094,22 @@ class SwitchController:
     def wait_for_sync(self, schalter_id: int) -> None:
         """Block until physical switch matches relay (startup sync).
         Skips after 10 failed attempts (register may not exist on this Cerbo)."""
-        gpio = self._gpio_for(schalter_id)
-        relais_addr = self._relais_addr_for(schalter_id)
+        sw = SWITCHES[schalter_id]
         fail_count = 0
 
         while True:
-            relay = self._modbus.read_relais(relais_addr)
+            relay = self._modbus.read_relais(sw.read_addr)
             if relay is None:
                 fail_count += 1
                 if fail_count >= 10:
                     log.warning("Skipping sync for switch %d – register %d "
                                 "unavailable after %d attempts",
-                                schalter_id, relais_addr, fail_count)
+                                schalter_id, sw.read_addr, fail_count)
                     break
                 self._display.display_lan_error()
                 time.sleep(0.5)
                 continue
-            if self.read_switch(gpio) == relay:
+            if self.read_switch(sw.gpio) == relay:
                 break
             log.info("Switch %d out of sync with relay, waiting...", schalter_id)
             self._display.display_schalter_start(schalter_id)
@@ -723,8 +1117,10 @@ class SwitchController:
 
     def close(self) -> None:
         """Release gpiozero resources."""
-        self._sw_generator.close()
-        self._sw_multiplus.close()
+        if self._gpiod_lines is not None:
+            self._gpiod_lines.release()
+        for btn in self._switch_buttons.values():
+            btn.close()
         self._btn.close()
 
 
@@ -746,7 +1142,7 @@ def main() -> None:
     if not cerbo_host:
         # Init OLED early for discovery status display
         try:
-            serial_early = i2c(port=I2C_PORT, address=I2C_ADDRESS)
+            serial_early = _make_serial()
             oled_early = sh1106(serial_early, rotate=DISPLAY_ROTATE)
         except Exception:
             oled_early = None
@@ -769,15 +1165,17 @@ def main() -> None:
                 try:
                     with canvas(oled_early) as draw:
                         draw.rectangle(oled_early.bounding_box, outline="white")
-                        draw.text((5, 10), "Kein Cerbo", font=ImageFont.truetype(FONT_PATH, 16), fill="white")
-                        draw.text((5, 30), "gefunden!", font=ImageFont.truetype(FONT_PATH, 16), fill="white")
+                        draw.text((5, 10), "Kein Cerbo", font=FONT_16, fill="white")
+                        draw.text((5, 30), "gefunden!", font=FONT_16, fill="white")
                 except Exception:
                     pass
             time.sleep(5)
             sys.exit(1)
 
     modbus = CerboModbus(host=cerbo_host)
-    display = OledDisplay(modbus)
+    poller = ModbusPoller(modbus)
+    poller.start()
+    display = OledDisplay(modbus, poller=poller)
     switches = SwitchController(modbus, display)
     running = True
 
@@ -816,6 +1214,8 @@ def main() -> None:
 
     # Cleanup
     log.info("Cleaning up...")
+    poller.stop()
+    poller.join(timeout=5)
     switches.close()
     modbus.close()
     sys.exit(0)
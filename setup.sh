@@ -14,6 +14,14 @@ sudo apt update && sudo apt upgrade -y
 echo "[2/6] System-Pakete installieren..."
 sudo apt install -y python3-pip python3-venv i2c-tools python3-smbus python3-dev libopenjp2-7 libtiff6
 
+# I2C auf 400 kHz stellen (Default 100 kHz ist für OLED-Refresh zu langsam)
+CONFIG_TXT=/boot/firmware/config.txt
+[ -f "$CONFIG_TXT" ] || CONFIG_TXT=/boot/config.txt
+if ! grep -q "i2c_arm_baudrate" "$CONFIG_TXT"; then
+    echo "dtparam=i2c_arm_baudrate=400000" | sudo tee -a "$CONFIG_TXT"
+    echo "  ✓ I2C-Baudrate auf 400 kHz gesetzt (Reboot nötig)"
+fi
+
 # I2C testen
 echo "[3/6] I2C prüfen..."
 if i2cdetect -y 1 | grep -q "3c"; then
@@ -0,0 +1,26 @@
+"""Tests for cerbo_display helpers (run with pytest on the Pi/venv)."""
+
+from cerbo_display import _to_signed16, _to_signed16_bulk
+
+# Raw word → expected signed value. 32768..65535 must come out negative;
+# the pre-fix code treated everything up to 60000 as positive, which broke
+# e.g. register 842 (battery power) during heavy discharge.
+SIGNED16_CASES = [
+    (0, 0),
+    (32767, 32767),
+    (32768, -32768),
+    (60001, -5535),
+    (65535, -1),
+]
+
+
+def test_to_signed16():
+    for raw, expected in SIGNED16_CASES:
+        assert _to_signed16(raw) == expected
+
+
+def test_to_signed16_bulk_matches_scalar():
+    raws = [raw for raw, _ in SIGNED16_CASES]
+    expected = [signed for _, signed in SIGNED16_CASES]
+    assert _to_signed16_bulk(raws) == expected
+    assert _to_signed16_bulk([]) == []